@@ -5,9 +5,11 @@ A Streamlit app to view and analyze scraped Google Ads data
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
+import io
 import os
 
 # Page configuration
@@ -40,41 +42,223 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Columns the dashboard reads from scraped CSVs
+CSV_DTYPES = {
+    'name': 'string',
+    'material-icon-i': 'string',
+    'verified-identity-text': 'string',
+    'ad-count': 'string',
+    'location': 'string'
+}
+
+@st.cache_data(ttl=3600)
 def load_sample_data():
     """Load sample data from results folder"""
     results_path = Path("results")
     if results_path.exists():
         csv_files = list(results_path.glob("*.csv"))
         if csv_files:
-            return pd.read_csv(csv_files[0])
+            return pd.read_csv(
+                csv_files[0],
+                usecols=lambda col: col in CSV_DTYPES,
+                dtype=CSV_DTYPES
+            )
     return None
 
-def parse_ad_count(ad_count_str):
-    """Extract numeric value from ad count string (e.g., '~63 ads' -> 63)"""
-    if pd.isna(ad_count_str):
-        return 0
-    try:
-        return int(str(ad_count_str).replace('~', '').replace('ads', '').strip())
-    except:
-        return 0
+@st.cache_data
+def load_uploaded(file_bytes: bytes):
+    """Load an uploaded CSV, keyed on its bytes so re-uploads hit the cache"""
+    return pd.read_csv(io.BytesIO(file_bytes), dtype=CSV_DTYPES)
+
+@st.cache_data
+def preprocess(df):
+    """Add parsed columns used by the dashboard"""
+    df = df.copy()
+    # Vectorized string parsing (e.g. '~63 ads' -> 63, 'Based in: South Korea' -> 'South Korea')
+    df['ad_count_numeric'] = pd.to_numeric(
+        df['ad-count'].str.extract(r'(\d+)', expand=False), errors='coerce'
+    ).fillna(0).astype('int32')
+    df['country'] = df['location'].str.removeprefix('Based in:').str.strip().fillna('Unknown').astype('category')
+    df['is_verified'] = df['verified-identity-text'].fillna('').ne('').astype(bool)
+    return df
+
+@st.cache_data
+def country_stats(df):
+    """Per-country advertiser, ad and verification totals in a single groupby pass"""
+    stats = df.groupby('country', observed=True).agg(
+        advertisers=('name', 'size'),
+        total_ads=('ad_count_numeric', 'sum'),
+        verified=('is_verified', 'sum')
+    ).reset_index()
+    stats['country'] = stats['country'].astype(str)
+    return stats
+
+@st.cache_data
+def build_country_bar(top10):
+    """Horizontal bar chart of the top 10 countries by advertiser count"""
+    fig = px.bar(
+        x=top10['advertisers'],
+        y=top10['country'],
+        orientation='h',
+        title="Top 10 Countries by Advertiser Count",
+        labels={'x': 'Number of Advertisers', 'y': 'Country'},
+        color=top10['advertisers'],
+        color_continuous_scale='Blues'
+    )
+    fig.update_layout(showlegend=False, height=400)
+    return fig
+
+@st.cache_data
+def build_ad_range_pie(ad_range_counts):
+    """Pie chart of advertisers grouped by ad count range"""
+    fig = px.pie(
+        values=ad_range_counts.values,
+        names=ad_range_counts.index,
+        title="Advertisers by Ad Count Range",
+        color_discrete_sequence=px.colors.sequential.Blues
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data
+def build_country_comparison(country_data):
+    """Grouped bar chart of advertisers vs verified advertisers per country"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name='Advertisers',
+        x=country_data['Country'],
+        y=country_data['Advertisers'],
+        marker_color='lightblue'
+    ))
+    fig.add_trace(go.Bar(
+        name='Verified',
+        x=country_data['Country'],
+        y=country_data['Verified'],
+        marker_color='darkblue'
+    ))
+    
+    fig.update_layout(
+        title="Top 20 Countries: Advertisers vs Verified",
+        xaxis_title="Country",
+        yaxis_title="Count",
+        barmode='group',
+        height=500
+    )
+    return fig
+
+@st.cache_data
+def build_verification_pie(verification_counts):
+    """Pie chart of verified vs not verified advertisers"""
+    return px.pie(
+        values=verification_counts.values,
+        names=['Verified' if x else 'Not Verified' for x in verification_counts.index],
+        title="Verification Status Distribution",
+        color_discrete_map={'Verified': '#2ecc71', 'Not Verified': '#e74c3c'}
+    )
 
-def parse_location(location_str):
-    """Extract country from location string (e.g., 'Based in: South Korea' -> 'South Korea')"""
-    if pd.isna(location_str):
-        return "Unknown"
-    return str(location_str).replace('Based in:', '').strip()
+@st.cache_data
+def build_verification_rate_bar(verification_by_country):
+    """Bar chart of verification rate for the top countries"""
+    fig = px.bar(
+        x=verification_by_country['country'],
+        y=verification_by_country['percentage'],
+        title="Verification Rate by Top Countries (%)",
+        labels={'x': 'Country', 'y': 'Verification Rate (%)'},
+        color=verification_by_country['percentage'],
+        color_continuous_scale='Greens'
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+@st.cache_data
+def encode_csv(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to UTF-8 CSV bytes for download"""
+    return df.to_csv(index=False).encode('utf-8')
+
+@st.fragment
+def filter_table(df):
+    """Filterable data table; reruns on its own when the filter widgets change"""
+    # Filters
+    st.subheader("🔍 Filter Data")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        selected_countries = st.multiselect(
+            "Select Countries",
+            options=sorted(df['country'].unique()),
+            default=None
+        )
+    
+    with col2:
+        verification_filter = st.selectbox(
+            "Verification Status",
+            options=["All", "Verified Only", "Not Verified Only"]
+        )
+    
+    with col3:
+        min_ads = st.number_input("Minimum Ad Count", min_value=0, value=0)
+    
+    # Apply filters as one combined boolean mask
+    mask = np.ones(len(df), dtype=bool)
+    
+    if selected_countries:
+        mask &= df['country'].isin(selected_countries).values
+    
+    if verification_filter == "Verified Only":
+        mask &= df['is_verified'].values
+    elif verification_filter == "Not Verified Only":
+        mask &= ~df['is_verified'].values
+    
+    if min_ads > 0:
+        mask &= df['ad_count_numeric'].values >= min_ads
+    
+    filtered_df = df.loc[mask]
+    
+    # Display filtered data
+    st.subheader(f"📋 Data Table ({len(filtered_df)} records)")
+    
+    # Select columns to display
+    display_df = filtered_df[['name', 'ad-count', 'location', 'verified-identity-text']].copy()
+    display_df.columns = ['Advertiser Name', 'Ad Count', 'Location', 'Verification Status']
+    
+    # Only send the current page of rows to the browser
+    page_size = 50
+    page_count = max(1, -(-len(display_df) // page_size))
+    page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, value=1)
+    start = (page - 1) * page_size
+    
+    st.dataframe(
+        display_df.iloc[start:start + page_size],
+        use_container_width=True,
+        height=500
+    )
+    
+    # Download button
+    st.download_button(
+        label="📥 Download Filtered Data as CSV",
+        data=encode_csv(filtered_df),
+        file_name="filtered_google_ads_data.csv",
+        mime="text/csv"
+    )
 
 def create_dashboard(df):
     """Create interactive dashboard with visualizations"""
     
-    # Parse data for better analysis
-    df['ad_count_numeric'] = df['ad-count'].apply(parse_ad_count)
-    df['country'] = df['location'].apply(parse_location)
-    df['is_verified'] = df['verified-identity-text'].notna() & (df['verified-identity-text'] != '')
-    
     # Header
     st.markdown('<div class="main-header">📊 Google Ads Transparency Dashboard</div>', unsafe_allow_html=True)
     
+    # Charts can't be built from a header-only CSV
+    if df.empty:
+        st.warning("The CSV file has no rows to analyze")
+        return
+    
+    # Parse data for better analysis
+    df = preprocess(df)
+    stats = country_stats(df)
+    top20 = stats.nlargest(20, 'advertisers')
+    top10 = top20.head(10)
+    
     # Key Metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -103,71 +287,44 @@ def create_dashboard(df):
         
         with col1:
             # Top 10 countries by advertiser count
-            country_counts = df['country'].value_counts().head(10)
-            fig = px.bar(
-                x=country_counts.values,
-                y=country_counts.index,
-                orientation='h',
-                title="Top 10 Countries by Advertiser Count",
-                labels={'x': 'Number of Advertisers', 'y': 'Country'},
-                color=country_counts.values,
-                color_continuous_scale='Blues'
-            )
-            fig.update_layout(showlegend=False, height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_country_bar(top10), use_container_width=True)
         
         with col2:
             # Ad count distribution
-            ad_ranges = pd.cut(df['ad_count_numeric'], bins=[0, 5, 20, 50, 100, float('inf')], 
-                              labels=['1-5', '6-20', '21-50', '51-100', '100+'])
-            ad_range_counts = ad_ranges.value_counts().sort_index()
-            
-            fig = px.pie(
-                values=ad_range_counts.values,
-                names=ad_range_counts.index,
-                title="Advertisers by Ad Count Range",
-                color_discrete_sequence=px.colors.sequential.Blues
-            )
-            fig.update_layout(height=400)
-            st.plotly_chart(fig, use_container_width=True)
+            # pd.cut returns an ordered categorical, so bin order is kept without sorting
+            ad_range_counts = pd.cut(df['ad_count_numeric'], bins=[0, 5, 20, 50, 100, np.inf], 
+                                     labels=['1-5', '6-20', '21-50', '51-100', '100+']).value_counts(sort=False)
+            st.plotly_chart(build_ad_range_pie(ad_range_counts), use_container_width=True)
     
     with tab2:
         # Geographic distribution
-        country_data = df.groupby('country').agg({
-            'name': 'count',
-            'ad_count_numeric': 'sum',
-            'is_verified': 'sum'
-        }).reset_index()
-        country_data.columns = ['Country', 'Advertisers', 'Total Ads', 'Verified']
-        country_data = country_data.sort_values('Advertisers', ascending=False).head(20)
-        
-        fig = go.Figure()
-        fig.add_trace(go.Bar(
-            name='Advertisers',
-            x=country_data['Country'],
-            y=country_data['Advertisers'],
-            marker_color='lightblue'
-        ))
-        fig.add_trace(go.Bar(
-            name='Verified',
-            x=country_data['Country'],
-            y=country_data['Verified'],
-            marker_color='darkblue'
-        ))
-        
-        fig.update_layout(
-            title="Top 20 Countries: Advertisers vs Verified",
-            xaxis_title="Country",
-            yaxis_title="Count",
-            barmode='group',
-            height=500
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        country_data = top20.rename(columns={
+            'country': 'Country',
+            'advertisers': 'Advertisers',
+            'total_ads': 'Total Ads',
+            'verified': 'Verified'
+        })
+        st.plotly_chart(build_country_comparison(country_data), use_container_width=True)
         
         # Country statistics table
         st.subheader("Country Statistics")
         st.dataframe(
-            country_data.style.background_gradient(subset=['Advertisers', 'Total Ads'], cmap='Blues'),
+            country_data,
+            column_config={
+                'Advertisers': st.column_config.ProgressColumn(
+                    'Advertisers',
+                    format="%d",
+                    min_value=0,
+                    max_value=int(country_data['Advertisers'].max())
+                ),
+                'Total Ads': st.column_config.ProgressColumn(
+                    'Total Ads',
+                    format="%d",
+                    min_value=0,
+                    max_value=int(country_data['Total Ads'].max())
+                )
+            },
+            hide_index=True,
             use_container_width=True,
             height=400
         )
@@ -179,89 +336,18 @@ def create_dashboard(df):
         with col1:
             # Verification status pie chart
             verification_counts = df['is_verified'].value_counts()
-            fig = px.pie(
-                values=verification_counts.values,
-                names=['Verified' if x else 'Not Verified' for x in verification_counts.index],
-                title="Verification Status Distribution",
-                color_discrete_map={'Verified': '#2ecc71', 'Not Verified': '#e74c3c'}
-            )
-            st.plotly_chart(fig, use_container_width=True)
+            st.plotly_chart(build_verification_pie(verification_counts), use_container_width=True)
         
         with col2:
             # Verification by top countries
-            top_countries = df['country'].value_counts().head(10).index
-            verification_by_country = df[df['country'].isin(top_countries)].groupby('country')['is_verified'].agg(['sum', 'count'])
-            verification_by_country['percentage'] = (verification_by_country['sum'] / verification_by_country['count'] * 100).round(1)
-            verification_by_country = verification_by_country.sort_values('percentage', ascending=False)
-            
-            fig = px.bar(
-                x=verification_by_country.index,
-                y=verification_by_country['percentage'],
-                title="Verification Rate by Top Countries (%)",
-                labels={'x': 'Country', 'y': 'Verification Rate (%)'},
-                color=verification_by_country['percentage'],
-                color_continuous_scale='Greens'
+            verification_by_country = top10.assign(
+                percentage=lambda s: (s['verified'] / s['advertisers'] * 100).round(1)
             )
-            fig.update_layout(showlegend=False)
-            st.plotly_chart(fig, use_container_width=True)
+            verification_by_country = verification_by_country.sort_values('percentage', ascending=False)
+            st.plotly_chart(build_verification_rate_bar(verification_by_country), use_container_width=True)
     
     with tab4:
-        # Filters
-        st.subheader("🔍 Filter Data")
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            selected_countries = st.multiselect(
-                "Select Countries",
-                options=sorted(df['country'].unique()),
-                default=None
-            )
-        
-        with col2:
-            verification_filter = st.selectbox(
-                "Verification Status",
-                options=["All", "Verified Only", "Not Verified Only"]
-            )
-        
-        with col3:
-            min_ads = st.number_input("Minimum Ad Count", min_value=0, value=0)
-        
-        # Apply filters
-        filtered_df = df.copy()
-        
-        if selected_countries:
-            filtered_df = filtered_df[filtered_df['country'].isin(selected_countries)]
-        
-        if verification_filter == "Verified Only":
-            filtered_df = filtered_df[filtered_df['is_verified'] == True]
-        elif verification_filter == "Not Verified Only":
-            filtered_df = filtered_df[filtered_df['is_verified'] == False]
-        
-        if min_ads > 0:
-            filtered_df = filtered_df[filtered_df['ad_count_numeric'] >= min_ads]
-        
-        # Display filtered data
-        st.subheader(f"📋 Data Table ({len(filtered_df)} records)")
-        
-        # Select columns to display
-        display_df = filtered_df[['name', 'ad-count', 'location', 'verified-identity-text']].copy()
-        display_df.columns = ['Advertiser Name', 'Ad Count', 'Location', 'Verification Status']
-        
-        st.dataframe(
-            display_df,
-            use_container_width=True,
-            height=500
-        )
-        
-        # Download button
-        csv = filtered_df.to_csv(index=False).encode('utf-8')
-        st.download_button(
-            label="📥 Download Filtered Data as CSV",
-            data=csv,
-            file_name="filtered_google_ads_data.csv",
-            mime="text/csv"
-        )
+        filter_table(df)
 
 def main():
     # Sidebar
@@ -285,7 +371,7 @@ def main():
             
             if uploaded_file is not None:
                 try:
-                    df = pd.read_csv(uploaded_file)
+                    df = load_uploaded(uploaded_file.getvalue())
                     st.success(f"✅ Loaded {len(df)} records")
                 except Exception as e:
                     st.error(f"Error loading file: {str(e)}")
@@ -2,8 +2,8 @@
 Redirect to the actual Streamlit app
 This file exists only to satisfy Streamlit Cloud's main module requirement
 """
-import subprocess
+import os
 import sys
 
-# Run the actual app
-subprocess.run([sys.executable, "-m", "streamlit", "run", "app.py"])
+# Replace this process with the actual app instead of keeping it alive as a parent
+os.execvp(sys.executable, [sys.executable, "-m", "streamlit", "run", "app.py"])
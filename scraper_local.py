@@ -3,18 +3,78 @@ Google Ads Transparency Scraper
 Extracts advertiser data including advertiser URLs and sample ad URLs
 """
 
-import time
 import csv
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+# Locators reused on every page
+OPTION_LOCATOR = (By.CSS_SELECTOR, "[role='option']")
+LISTBOX_OPTION_LOCATOR = (By.CSS_SELECTOR, "[role='listbox'] [role='option']")
+CREATIVE_LINK_LOCATOR = (By.CSS_SELECTOR, "a[href*='/creative/']")
+NEXT_BUTTON_LOCATOR = (By.XPATH, "//button[contains(., 'Next')]")
+
+# Reads every advertiser option on the results page in a single round-trip
+EXTRACT_OPTIONS_JS = """
+return Array.from(document.querySelectorAll("[role='option']")).map(o => {
+    const lines = o.innerText.split('\\n').map(l => l.trim()).filter(l => l);
+    const text = sel => { const e = o.querySelector(sel); return e ? e.innerText.trim() : null; };
+    // Fall back to the last matching text line, skipping the name on the first line
+    const lastLine = test => lines.slice(1).filter(test).pop() || null;
+    const adsLine = text('.ad-count') || lastLine(l => l.toLowerCase().includes('ad') && /\\d/.test(l));
+    const locationLine = text('.location') || lastLine(l => l.includes('Based in:'));
+    const link = o.closest('a[href]') || o.querySelector('a[href]');
+    return {
+        name: text('.name') || lines[0] || '',
+        ads: adsLine || null,
+        based_in: locationLine ? locationLine.replace('Based in:', '').trim() : null,
+        verified: !!o.querySelector('.verified-identity') || lines.slice(1).some(l => l.toLowerCase().includes('verified')),
+        url: link ? link.href : null
+    };
+});
+"""
+
+# Reads the advertiser name of one option, matching EXTRACT_OPTIONS_JS
+OPTION_NAME_JS = """
+const e = arguments[0].querySelector('.name');
+return e ? e.innerText.trim() : arguments[0].innerText.split('\\n').map(l => l.trim()).filter(l => l)[0] || '';
+"""
+
+# Reads every creative link on an advertiser page in a single round-trip
+CREATIVE_HREFS_JS = "return Array.from(document.querySelectorAll('a[href*=\"/creative/\"]')).map(a => a.href);"
+
+# Resource types the scraper never reads (images are disabled through Chrome prefs)
+BLOCKED_URL_PATTERNS = [
+    "*.woff", "*.woff2", "*.ttf", "*.otf",
+    "*.mp4", "*.webm", "*.mp3", "*.ogg",
+    "*fonts.googleapis.com*", "*fonts.gstatic.com*"
+]
+
+ADVERTISER_ID_PATTERN = re.compile(r'/advertiser/([^/?#]+)')
+
+FIELDNAMES = ["advertiser_name", "number_of_ads", "based_in", "verified",
+              "advertiser_url", "sample_ad_url", "scrape_date"]
+
+def build_search_url(region, query):
+    """Build the Transparency Center search URL for a query"""
+    return f"https://adstransparency.google.com/search?region={region}&query={query}"
+
+def parse_advertiser_id(url):
+    """Extract the advertiser ID from an advertiser URL (e.g. '.../advertiser/AR123?region=US' -> 'AR123')"""
+    if not url:
+        return None
+    match = ADVERTISER_ID_PATTERN.search(url)
+    return match.group(1) if match else None
 
 class GoogleAdsTransparencyScraper:
-    def __init__(self, start_query="a", region="anywhere", output_file="advertisers_data.csv"):
+    def __init__(self, start_query="a", region="anywhere", output_file="advertisers_data.csv", max_workers=4):
         """
         Initialize the scraper
         
@@ -22,166 +82,293 @@ class GoogleAdsTransparencyScraper:
             start_query: Initial search query (default: "a")
             region: Region code (default: "anywhere")
             output_file: Output CSV filename
+            max_workers: Number of parallel browsers used to visit advertiser pages
         """
-        self.base_url = f"https://adstransparency.google.com/search?region={region}&query={start_query}"
+        self.base_url = build_search_url(region, start_query)
         self.region = region
         self.output_file = output_file
-        self.data = []
         self.driver = None
+        self._csv_fh = None
+        self._writer = None
+        # Rows are streamed to disk, only running totals and a few samples are kept
+        self.total_count = 0
+        self.verified_count = 0
+        self.with_ad_links_count = 0
+        self.sample_records = []
         self.scraped_advertisers = set()  # Track scraped advertisers to avoid duplicates
+        self.scraped_ids = set()  # Advertiser IDs already scraped, more reliable than names
+        self.max_workers = max_workers
+        self.executor = None
+        self.worker_drivers = []
+        self._worker_local = threading.local()
+        self._worker_lock = threading.Lock()
+        # Shared with shard scrapers when running several queries in parallel
+        self.parent = None
+        self.stop_event = threading.Event()
+        self._state_lock = threading.Lock()
         
-    def setup_driver(self):
-        """Initialize Selenium WebDriver"""
+    def create_driver(self):
+        """Create a configured Selenium WebDriver"""
         chrome_options = Options()
-        # chrome_options.add_argument("--headless")  # Uncomment for headless mode
+        chrome_options.add_argument("--headless=new")  # Comment out to watch the browser
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-background-networking")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
+        # Only the DOM is read, so skip downloading and decoding images
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2
+        })
+        # Return from driver.get on DOMContentLoaded, elements are waited for explicitly
+        chrome_options.page_load_strategy = 'eager'
         
-        self.driver = webdriver.Chrome(options=chrome_options)
-        self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.execute_cdp_cmd('Network.setUserAgentOverride', {
             "userAgent": 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        # Fonts and media aren't needed to read the DOM
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {"urls": BLOCKED_URL_PATTERNS})
+        return driver
+    
+    def setup_driver(self):
+        """Initialize the main Selenium WebDriver and the advertiser page worker pool"""
+        self.driver = self.create_driver()
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+    
+    def get_worker_driver(self):
+        """Return the WebDriver owned by the current worker thread, creating it on first use"""
+        driver = getattr(self._worker_local, "driver", None)
+        if driver is None:
+            driver = self.create_driver()
+            self._worker_local.driver = driver
+            with self._worker_lock:
+                self.worker_drivers.append(driver)
+        return driver
+    
+    def close_drivers(self):
+        """Shut down the worker pool and quit all browsers"""
+        if self.executor:
+            # Drop queued advertiser page visits so an interrupt closes the browsers promptly
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+        for driver in self.worker_drivers:
+            try:
+                driver.quit()
+            except:
+                pass
+        self.worker_drivers = []
+        if self.driver:
+            self.driver.quit()
+            self.driver = None
+        
+    def open_output(self):
+        """Open the output CSV and write the header"""
+        self._csv_fh = open(self.output_file, 'w', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._csv_fh, fieldnames=FIELDNAMES)
+        self._writer.writeheader()
+    
+    def close_output(self):
+        """Close the output CSV"""
+        if self._csv_fh:
+            self._csv_fh.close()
+            self._csv_fh = None
+            self._writer = None
+            print(f"\n✓ Data saved to {self.output_file}")
+            print(f"Total advertisers scraped: {self.total_count}")
+    
+    def write_row(self, data_dict):
+        """Append one advertiser row to the output CSV and update the running totals"""
+        if self.parent:
+            self.parent.write_row(data_dict)
+            return
         
+        with self._state_lock:
+            self._writer.writerow(data_dict)
+            self._csv_fh.flush()
+            
+            self.total_count += 1
+            if data_dict['verified']:
+                self.verified_count += 1
+            if data_dict['sample_ad_url']:
+                self.with_ad_links_count += 1
+            if len(self.sample_records) < 5:
+                self.sample_records.append(data_dict)
+    
+    def claim(self, seen, key):
+        """Record key in seen, returning False if another page or shard already claimed it"""
+        with self._state_lock:
+            if key in seen:
+                return False
+            seen.add(key)
+            return True
+    
     def extract_advertiser_data(self):
         """Extract advertiser data from current page"""
         try:
-            # Wait for listbox to load
+            # Wait for the advertiser options to render
             wait = WebDriverWait(self.driver, 15)
-            listbox = wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "[role='listbox']"))
-            )
+            wait.until(EC.presence_of_element_located(LISTBOX_OPTION_LOCATOR))
             
-            # Wait a bit for all elements to render
-            time.sleep(2)
-            
-            # Get all options (advertiser items)
-            options = self.driver.find_elements(By.CSS_SELECTOR, "[role='option']")
+            # Get all options (advertiser items) as structured fields
+            options = self.driver.execute_script(EXTRACT_OPTIONS_JS)
             print(f"Found {len(options)} advertisers on this page")
             
+            # One timestamp per page is enough
+            scrape_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            
+            page_rows = []
             for idx, option in enumerate(options):
-                try:
-                    # Extract advertiser name
-                    name_elem = option.find_element(By.CSS_SELECTOR, "span:first-child")
-                    advertiser_name = name_elem.text.strip()
-                    
-                    # Skip if already scraped
-                    if advertiser_name in self.scraped_advertisers:
+                advertiser_name = option["name"]
+                advertiser_id = parse_advertiser_id(option["url"])
+                
+                # Skip if already scraped, by ID when the option links to its advertiser
+                if advertiser_id:
+                    if not self.claim(self.scraped_ids, advertiser_id):
                         continue
-                    
-                    # Extract number of ads
-                    ads_text = None
-                    based_in = None
-                    verified = False
-                    
-                    # Get all text content
-                    text_content = option.text
-                    lines = [line.strip() for line in text_content.split('\n') if line.strip()]
-                    
-                    # Parse lines
-                    for line in lines:
-                        if "ad" in line.lower() and any(char.isdigit() for char in line):
-                            ads_text = line.strip()
-                        elif "Based in:" in line:
-                            based_in = line.replace("Based in:", "").strip()
-                    
-                    # Check if verified
-                    try:
-                        option.find_element(By.XPATH, ".//span[contains(text(), 'verified') or contains(text(), 'Verified')]")
-                        verified = True
-                    except NoSuchElementException:
-                        verified = False
-                    
-                    # Get advertiser URL and one ad link
-                    advertiser_url, ad_link = self.get_advertiser_and_ad_url(option, advertiser_name)
-                    
-                    # Store data
-                    data_dict = {
-                        "advertiser_name": advertiser_name,
-                        "number_of_ads": ads_text,
-                        "based_in": based_in,
-                        "verified": verified,
-                        "advertiser_url": advertiser_url,
-                        "sample_ad_url": ad_link,
-                        "scrape_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    }
-                    
-                    self.data.append(data_dict)
-                    self.scraped_advertisers.add(advertiser_name)
-                    print(f"✓ [{idx+1}/{len(options)}] {advertiser_name} | Ads: {ads_text} | Location: {based_in} | Verified: {verified}")
-                    
-                except Exception as e:
-                    print(f"Error extracting advertiser {idx+1}: {str(e)}")
+                elif not self.claim(self.scraped_advertisers, advertiser_name):
                     continue
+                
+                # Store data (missing URLs are filled in once all options are read)
+                data_dict = {
+                    "advertiser_name": advertiser_name,
+                    "number_of_ads": option["ads"],
+                    "based_in": option["based_in"],
+                    "verified": option["verified"],
+                    "advertiser_url": option["url"],
+                    "sample_ad_url": None,
+                    "scrape_date": scrape_date
+                }
+                
+                page_rows.append((idx, data_dict))
+            
+            # Only click through options that don't expose a link. Navigating away
+            # invalidates the option elements, so this runs after all options are read
+            unique_rows = []
+            for idx, data_dict in page_rows:
+                if not data_dict["advertiser_url"]:
+                    data_dict["advertiser_url"] = self.get_advertiser_url(idx, data_dict["advertiser_name"])
+                    
+                    # Skip the ad lookup for an advertiser already seen under another name
+                    advertiser_id = parse_advertiser_id(data_dict["advertiser_url"])
+                    if advertiser_id and not self.claim(self.scraped_ids, advertiser_id):
+                        continue
+                
+                unique_rows.append((idx, data_dict))
+            page_rows = unique_rows
+            
+            # Look up one ad per advertiser in parallel worker browsers
+            advertiser_urls = [data_dict["advertiser_url"] for _, data_dict in page_rows]
+            ad_links = self.executor.map(self.get_sample_ad_url, advertiser_urls)
+            
+            for (idx, data_dict), ad_link in zip(page_rows, ad_links):
+                data_dict["sample_ad_url"] = ad_link
+                self.write_row(data_dict)
+                print(f"✓ [{idx+1}/{len(options)}] {data_dict['advertiser_name']} | Ads: {data_dict['number_of_ads']} | Location: {data_dict['based_in']} | Verified: {data_dict['verified']}")
                     
         except Exception as e:
             print(f"Error in extract_advertiser_data: {str(e)}")
     
-    def get_advertiser_and_ad_url(self, option_element, advertiser_name):
+    def get_advertiser_url(self, option_index, advertiser_name):
         """
-        Get the advertiser URL and one ad URL by clicking through
+        Get the advertiser URL by clicking the option at the given index
         """
         advertiser_url = None
-        ad_link = None
         original_url = self.driver.current_url
         
         try:
+            # Re-locate the option, earlier elements are stale after navigating back
+            option_element = self.driver.find_elements(*OPTION_LOCATOR)[option_index]
+            
+            # The results may have changed on reload, don't take another advertiser's URL
+            found_name = self.driver.execute_script(OPTION_NAME_JS, option_element)
+            if found_name != advertiser_name:
+                print(f"  Option {option_index+1} is now {found_name!r}, skipping URL for {advertiser_name}")
+                return None
+            
             # Scroll element into view
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", option_element)
-            time.sleep(0.5)
             
-            # Click the option to navigate to advertiser page
+            # Click the option and wait for the advertiser page to open
             option_element.click()
-            time.sleep(3)
+            WebDriverWait(self.driver, 10).until(EC.url_contains("/advertiser/"))
             
             # Get advertiser URL
             current_url = self.driver.current_url
             if "advertiser" in current_url:
                 advertiser_url = current_url
-                
-                # Now try to get one ad link
-                try:
-                    wait = WebDriverWait(self.driver, 10)
-                    # Look for ad creative cards or links
-                    ad_elements = self.driver.find_elements(By.CSS_SELECTOR, "[role='option'], a[href*='/creative/']")
-                    
-                    if ad_elements:
-                        for ad_elem in ad_elements[:5]:  # Check first 5 elements
-                            try:
-                                ad_elem.click()
-                                time.sleep(2)
-                                
-                                if "/creative/" in self.driver.current_url:
-                                    ad_link = self.driver.current_url
-                                    break
-                            except:
-                                continue
-                                
-                except Exception as e:
-                    print(f"  Could not extract ad link for {advertiser_name}: {str(e)}")
             
             # Navigate back to search results
-            self.driver.get(original_url)
-            time.sleep(2)
+            self.return_to_results(original_url)
             
         except Exception as e:
-            print(f"  Error getting URLs for {advertiser_name}: {str(e)}")
+            print(f"  Error getting URL for {advertiser_name}: {str(e)}")
             # Try to navigate back
             try:
-                self.driver.get(original_url)
-                time.sleep(2)
+                self.return_to_results(original_url)
             except:
                 pass
         
-        return advertiser_url, ad_link
+        return advertiser_url
+    
+    def return_to_results(self, url):
+        """Reload the search results and wait for the options to render"""
+        self.driver.get(url)
+        WebDriverWait(self.driver, 15).until(EC.presence_of_element_located(LISTBOX_OPTION_LOCATOR))
+    
+    def get_sample_ad_url(self, advertiser_url):
+        """
+        Open an advertiser page in a worker browser and return one ad URL
+        """
+        if not advertiser_url:
+            return None
+        
+        ad_link = None
+        
+        try:
+            # A worker browser that fails to start only loses this row's ad link
+            driver = self.get_worker_driver()
+            driver.get(advertiser_url)
+            
+            # Wait for creatives to render; fall through to the card click fallback if none do
+            try:
+                WebDriverWait(driver, 10).until(EC.presence_of_element_located(CREATIVE_LINK_LOCATOR))
+            except TimeoutException:
+                pass
+            
+            creative_hrefs = driver.execute_script(CREATIVE_HREFS_JS)
+            
+            if creative_hrefs:
+                ad_link = creative_hrefs[0]
+            else:
+                # Fall back to clicking ad creative cards
+                ad_elements = driver.find_elements(*OPTION_LOCATOR)
+                
+                for ad_elem in ad_elements[:5]:  # Check first 5 elements
+                    try:
+                        ad_elem.click()
+                        WebDriverWait(driver, 5).until(EC.url_contains("/creative/"))
+                        ad_link = driver.current_url
+                        break
+                    except:
+                        continue
+                        
+        except Exception as e:
+            print(f"  Could not extract ad link from {advertiser_url}: {str(e)}")
+        
+        return ad_link
     
     def check_next_button(self):
         """Check if Next button is enabled"""
         try:
-            next_button = self.driver.find_element(By.XPATH, "//button[contains(., 'Next')]")
+            next_button = self.driver.find_element(*NEXT_BUTTON_LOCATOR)
             is_disabled = next_button.get_attribute("aria-disabled") == "true"
             is_enabled = not is_disabled and next_button.is_enabled()
             return is_enabled, next_button
@@ -191,10 +378,19 @@ class GoogleAdsTransparencyScraper:
     def click_next_page(self, next_button):
         """Click the Next button to go to next page"""
         try:
+            # Remember the current first result so we can tell when the page changes
+            first_option = self.driver.find_element(*OPTION_LOCATOR)
+            
             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", next_button)
-            time.sleep(0.5)
             next_button.click()
-            time.sleep(3)  # Wait for page to load
+            
+            # Wait for the old results to be replaced by the next page
+            wait = WebDriverWait(self.driver, 10)
+            try:
+                wait.until(EC.staleness_of(first_option))
+            except TimeoutException:
+                pass
+            wait.until(EC.presence_of_element_located(OPTION_LOCATOR))
             return True
         except Exception as e:
             print(f"Error clicking next button: {str(e)}")
@@ -207,15 +403,92 @@ class GoogleAdsTransparencyScraper:
         Args:
             max_pages: Maximum number of pages to scrape (None for all pages)
         """
+        try:
+            self.open_output()
+            self.setup_driver()
+            self.search(self.base_url, max_pages)
+        except KeyboardInterrupt:
+            print("\n\n⚠ Scraping interrupted by user")
+        except Exception as e:
+            print(f"\n❌ Error during scraping: {str(e)}")
+        finally:
+            if self.driver:
+                self.close_drivers()
+                print("\n✓ Browser closed")
+            self.close_output()
+    
+    def scrape_queries(self, queries, max_pages=None, max_shards=2):
+        """
+        Scrape several search queries in parallel
+        
+        Queries are split round-robin into shards. Each shard runs in its own thread
+        with its own search browser and advertiser page workers, so up to
+        max_shards * (1 + max_workers) Chrome instances are open at once.
+        
+        Args:
+            queries: Search queries to scrape (e.g. "abcdefghijklmnopqrstuvwxyz")
+            max_pages: Maximum number of pages to scrape per query (None for all pages)
+            max_shards: Number of queries scraped at the same time
+        """
+        queries = list(queries)
+        shards = [queries[i::max_shards] for i in range(max_shards) if queries[i::max_shards]]
+        if not shards:
+            print("No queries to scrape")
+            return
+        
+        try:
+            self.open_output()
+            with ThreadPoolExecutor(max_workers=len(shards)) as pool:
+                futures = [pool.submit(self.scrape_shard, shard, max_pages) for shard in shards]
+                try:
+                    for future in futures:
+                        future.result()
+                except KeyboardInterrupt:
+                    # Let shards finish their current page and close their browsers
+                    self.stop_event.set()
+                    print("\n\n⚠ Scraping interrupted by user, finishing current pages...")
+        finally:
+            self.close_output()
+    
+    def scrape_shard(self, queries, max_pages=None):
+        """Scrape a shard of queries in separate browsers, writing into this scraper's output"""
+        shard = GoogleAdsTransparencyScraper(region=self.region, output_file=self.output_file,
+                                             max_workers=self.max_workers)
+        shard.parent = self
+        shard.stop_event = self.stop_event
+        shard.scraped_advertisers = self.scraped_advertisers
+        shard.scraped_ids = self.scraped_ids
+        shard._state_lock = self._state_lock
+        
+        # The shard's browsers stay open across all of its queries
+        try:
+            shard.setup_driver()
+            for query in queries:
+                if self.stop_event.is_set():
+                    break
+                shard.search(build_search_url(self.region, query), max_pages)
+        except Exception as e:
+            print(f"\n❌ Error starting shard browsers: {str(e)}")
+        finally:
+            if shard.driver:
+                shard.close_drivers()
+                print("\n✓ Shard browsers closed")
+    
+    def search(self, url, max_pages=None):
+        """
+        Open a search URL in the already set up browser and scrape its result pages
+        
+        Args:
+            url: Transparency Center search URL
+            max_pages: Maximum number of pages to scrape (None for all pages)
+        """
         page_count = 1
         
         try:
-            self.setup_driver()
-            print(f"Opening: {self.base_url}")
-            self.driver.get(self.base_url)
-            time.sleep(4)  # Initial page load
+            print(f"Opening: {url}")
+            self.driver.get(url)  # extract_advertiser_data waits for the results to render
             
-            while True:
+            while not self.stop_event.is_set():
                 print(f"\n{'='*80}")
                 print(f"📄 Processing Page {page_count}...")
                 print(f"{'='*80}")
@@ -242,57 +515,27 @@ class GoogleAdsTransparencyScraper:
                     print("\n✓ Reached end of results (Next button disabled or not found)")
                     break
                     
-        except KeyboardInterrupt:
-            print("\n\n⚠ Scraping interrupted by user")
         except Exception as e:
             print(f"\n❌ Error during scraping: {str(e)}")
-        finally:
-            if self.driver:
-                self.driver.quit()
-                print("\n✓ Browser closed")
-    
-    def save_to_csv(self):
-        """Save collected data to CSV file"""
-        if not self.data:
-            print("No data to save")
-            return
-        
-        try:
-            fieldnames = ["advertiser_name", "number_of_ads", "based_in", "verified", 
-                         "advertiser_url", "sample_ad_url", "scrape_date"]
-            
-            with open(self.output_file, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(self.data)
-            
-            print(f"\n✓ Data saved to {self.output_file}")
-            print(f"Total advertisers scraped: {len(self.data)}")
-            
-        except Exception as e:
-            print(f"Error saving to CSV: {str(e)}")
     
     def print_summary(self):
         """Print summary of scraped data"""
-        if not self.data:
+        if not self.total_count:
             print("No data scraped")
             return
         
         print(f"\n{'='*80}")
         print(f"SCRAPING SUMMARY")
         print(f"{'='*80}")
-        print(f"Total Advertisers: {len(self.data)}")
-        verified_count = sum(1 for d in self.data if d['verified'])
-        print(f"Verified: {verified_count}")
-        print(f"Unverified: {len(self.data) - verified_count}")
-        
-        with_ad_links = sum(1 for d in self.data if d['sample_ad_url'])
-        print(f"With Ad Links: {with_ad_links}")
+        print(f"Total Advertisers: {self.total_count}")
+        print(f"Verified: {self.verified_count}")
+        print(f"Unverified: {self.total_count - self.verified_count}")
+        print(f"With Ad Links: {self.with_ad_links_count}")
         print(f"{'='*80}")
         
         # Print first 5 records as sample
         print("\nSample Data (First 5):")
-        for i, record in enumerate(self.data[:5], 1):
+        for i, record in enumerate(self.sample_records, 1):
             print(f"\n{i}. {record['advertiser_name']}")
             print(f"   Ads: {record['number_of_ads']}")
             print(f"   Based in: {record['based_in']}")
@@ -313,10 +556,9 @@ if __name__ == "__main__":
     print("Starting Google Ads Transparency Scraper...")
     print("⚠ Note: This will take time as it visits each advertiser page\n")
     
+    # Rows are written to output_file as they are scraped
     scraper.scrape_all_pages(max_pages=5)  # Change to None to scrape all pages
-    
-    # Save results
-    scraper.save_to_csv()
+    # scraper.scrape_queries("abcdefghijklmnopqrstuvwxyz", max_pages=5)  # Or scrape several queries in parallel
     
     # Print summary
     scraper.print_summary()